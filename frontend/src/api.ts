@@ -53,3 +53,40 @@ export async function fetchRegionsNear(
   if (!res.ok) throw new Error(`Failed to fetch regions: ${res.status}`)
   return res.json()
 }
+
+export type RegionTrend = {
+  name: string
+  latest_month: string
+  latest_delta: number | null
+  months: string[]
+  incident_counts: number[]
+  e33_shares: number[]
+  crime_types: string[]
+  crime_type_mix: Record<string, number>
+  rolling_means: number[]
+  z_scores: (number | null)[]
+  anomalies: boolean[]
+  window: number
+}
+
+export type RegionRiser = {
+  name: string
+  month_year: string
+  incident_count: number
+  delta: number
+  rolling_mean: number
+  z_score: number | null
+  anomaly: boolean
+}
+
+export async function fetchRegionTrend(name: string): Promise<RegionTrend> {
+  const res = await fetch(`${API_BASE}/regions/${encodeURIComponent(name)}/trend`)
+  if (!res.ok) throw new Error(`Failed to fetch trend: ${res.status}`)
+  return res.json()
+}
+
+export async function fetchRegionRisers(limit = 10): Promise<RegionRiser[]> {
+  const res = await fetch(`${API_BASE}/regions/risers?limit=${limit}`)
+  if (!res.ok) throw new Error(`Failed to fetch risers: ${res.status}`)
+  return res.json()
+}
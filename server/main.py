@@ -2,14 +2,16 @@
 from __future__ import annotations
 
 import math
+from contextlib import asynccontextmanager
 from typing import List, Optional
 
 from fastapi import FastAPI, Depends, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 
-from .db import SessionLocal
-from .models import Call, Region
+from .db import Base, SessionLocal, engine
+from .models import Call, Region, RegionTrend
+from .trends import trend_to_dict
 
 # ---------------------------------------------------------------------
 # DB dependency
@@ -41,7 +43,15 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
 # ---------------------------------------------------------------------
 # FastAPI app
 # ---------------------------------------------------------------------
-app = FastAPI(title="Groningen Crime Map API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Add region_trends to existing DBs; filling it is a separate, one-off
+    # step (python -m server.trends rebuild), not something every worker does
+    Base.metadata.create_all(bind=engine)
+    yield
+
+
+app = FastAPI(title="Groningen Crime Map API", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -124,3 +134,49 @@ def get_regions_near(
         return []
 
     return result
+
+# ---------------------------------------------------------------------
+# Region trends (precomputed per-region monthly series)
+# ---------------------------------------------------------------------
+@app.get("/regions/risers")
+def get_region_risers(
+    limit: int = Query(10, gt=0, le=100),
+    db: Session = Depends(get_db),
+):
+    latest = (
+        db.query(RegionTrend.latest_month)
+        .order_by(RegionTrend.latest_month.desc())
+        .limit(1)
+        .scalar()
+    )
+    if latest is None:
+        return []
+
+    trends = (
+        db.query(RegionTrend)
+        .filter(RegionTrend.latest_month == latest)
+        .filter(RegionTrend.latest_delta.isnot(None))  # single-month series have no delta
+        .order_by(RegionTrend.latest_delta.desc())
+        .limit(limit)
+        .all()
+    )
+    return [
+        {
+            "name": t.name,
+            "month_year": t.latest_month,
+            "incident_count": t.incident_counts[-1],
+            "delta": t.latest_delta,
+            "rolling_mean": t.rolling_means[-1],
+            "z_score": t.z_scores[-1],
+            "anomaly": t.anomalies[-1],
+        }
+        for t in trends
+    ]
+
+
+@app.get("/regions/{name}/trend")
+def get_region_trend(name: str, db: Session = Depends(get_db)):
+    trend = db.query(RegionTrend).filter(RegionTrend.name == name).first()
+    if trend is None:
+        raise HTTPException(status_code=404, detail=f"No trend data for region '{name}'")
+    return trend_to_dict(trend)
@@ -1,5 +1,5 @@
 # server/models.py
-from sqlalchemy import Column, Integer, Float, String, Boolean
+from sqlalchemy import Column, Integer, Float, String, Boolean, JSON
 from .db import Base
 
 class Call(Base):
@@ -26,3 +26,26 @@ class Region(Base):
     e33_count = Column(Integer, default=0)     # subset of incidents that are E33
     month_year = Column(String, index=True)    # e.g. "2025-07"
     prevalent_crime_type = Column(String)      # e.g. "drugs", "robberies", "violent", "other"
+
+
+class RegionTrend(Base):
+    """Per-region monthly time series, appended to as each month lands."""
+    __tablename__ = "region_trends"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True)
+    months = Column(JSON, default=list)            # ["2025-07", "2025-08", ...]
+    incident_counts = Column(JSON, default=list)   # one int per month
+    e33_shares = Column(JSON, default=list)        # e33_count / incident_count per month
+    crime_types = Column(JSON, default=list)       # prevalent crime type per month
+    crime_type_counts = Column(JSON, default=dict) # months each type was prevalent
+    rolling_means = Column(JSON, default=list)     # mean incidents over the trailing window
+    z_scores = Column(JSON, default=list)          # vs. the preceding window, None if too short
+    anomalies = Column(JSON, default=list)         # abs(z) >= threshold
+
+    # running sums for the trailing window, so a new month doesn't rescan history
+    window_sum = Column(Float, default=0.0)
+    window_sumsq = Column(Float, default=0.0)
+
+    latest_month = Column(String, index=True)
+    latest_delta = Column(Integer, index=True)  # month-over-month incident change, None for 1 month
@@ -1,8 +1,10 @@
 # server/seed_data.py
+# Run from the repo root:  python -m server.seed_data
 import os
 from sqlalchemy.orm import Session
 from .db import Base, engine, SessionLocal
 from .models import Call, Region
+from .trends import rebuild_trends
 
 def reset_db():
     if os.path.exists(os.path.join(os.path.dirname(__file__), "city_safety.db")):
@@ -137,6 +139,8 @@ def seed():
     ]
     db.add_all(regions)
     db.commit()
+
+    rebuild_trends(db)
     db.close()
     print("✅ Seeded DB with Groningen calls & regions (incl. E33).")
 
@@ -1,10 +1,13 @@
 # seed_groningen_city_safety.py
+#
+# Seeds the app DB (server/city_safety.db) with 24 months of synthetic data.
+# Run from the repo root:  python -m server.seed_groningen_city_safety
 import sqlite3
 import random
-from pathlib import Path
 from datetime import datetime
 
-DB_PATH = Path(__file__).parent / "city-safety.db"
+from .db import Base, DB_PATH, SessionLocal, engine
+from .trends import ingest_month
 
 random.seed(1122025)
 
@@ -108,10 +111,12 @@ def ensure_schema(conn: sqlite3.Connection):
     conn.commit()
 
 
-def clear_existing(conn: sqlite3.Connection):
+def reset_tables(conn: sqlite3.Connection):
+    # Drop rather than clear: the DB may hold seed_data's ORM layout
     cur = conn.cursor()
-    cur.execute("DELETE FROM Regions")
-    cur.execute("DELETE FROM Calls")
+    cur.execute("DROP TABLE IF EXISTS Regions")
+    cur.execute("DROP TABLE IF EXISTS Calls")
+    cur.execute("DROP TABLE IF EXISTS region_trends")
     conn.commit()
 
 
@@ -313,8 +318,9 @@ def generate_calls_for_region_month(region_row, approx_calls=6):
 def main():
     print(f"Using DB at {DB_PATH}")
     conn = connect()
+    reset_tables(conn)
     ensure_schema(conn)
-    clear_existing(conn)
+    Base.metadata.create_all(bind=engine)  # region_trends
 
     cur = conn.cursor()
 
@@ -329,14 +335,21 @@ def main():
             calls = generate_calls_for_region_month(region_data)
             all_calls.extend(calls)
 
-    # Insert regions
-    cur.executemany(
-        """
-        INSERT INTO Regions (name, month_year, crime_level, incident_count, crime_type, e33_rate, lat, lon)
-        VALUES (:name, :month_year, :crime_level, :incident_count, :crime_type, :e33_rate, :lat, :lon)
-        """,
-        region_rows,
-    )
+    # Insert regions month by month, updating trend series as each month lands
+    db = SessionLocal()
+    try:
+        for month_year in MONTHS:
+            cur.executemany(
+                """
+                INSERT INTO Regions (name, month_year, crime_level, incident_count, crime_type, e33_rate, lat, lon)
+                VALUES (:name, :month_year, :crime_level, :incident_count, :crime_type, :e33_rate, :lat, :lon)
+                """,
+                [r for r in region_rows if r["month_year"] == month_year],
+            )
+            conn.commit()
+            ingest_month(db, month_year)
+    finally:
+        db.close()
 
     # Insert calls
     cur.executemany(
@@ -0,0 +1,184 @@
+# server/test_trends.py
+import random
+import sqlite3
+import statistics
+import warnings
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from server.db import Base
+from server.main import app, get_db
+from server.models import Region, RegionTrend
+from server.seed_groningen_city_safety import ensure_schema
+from server.trends import WINDOW, ingest_month, ingest_region_month, rebuild_trends
+
+MONTHS = [f"{y}-{m:02d}" for y in (2023, 2024) for m in range(1, 13)]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _counts(seed=7):
+    rng = random.Random(seed)
+    return [rng.randint(80, 160) for _ in MONTHS]
+
+
+def _ingest(db, name, counts):
+    for month_year, c in zip(MONTHS, counts):
+        ingest_region_month(db, name, month_year, c, c // 10, "Geweld")
+        db.flush()
+    db.commit()
+    return db.query(RegionTrend).filter(RegionTrend.name == name).one()
+
+
+def test_incremental_window_matches_brute_force(db):
+    counts = _counts()
+    trend = _ingest(db, "Selwerd", counts)
+
+    for i, x in enumerate(counts):
+        window = counts[max(0, i - WINDOW + 1) : i + 1]
+        assert trend.rolling_means[i] == pytest.approx(statistics.mean(window), abs=1e-3)
+
+        prev = counts[max(0, i - WINDOW) : i]
+        if len(prev) < WINDOW:
+            assert trend.z_scores[i] is None
+        else:
+            z = (x - statistics.mean(prev)) / statistics.stdev(prev)
+            assert trend.z_scores[i] == pytest.approx(z, abs=1e-3)
+            assert trend.anomalies[i] == (abs(trend.z_scores[i]) >= 2.0)
+
+    assert trend.latest_delta == counts[-1] - counts[-2]
+
+
+def test_out_of_order_month_rejected(db):
+    _ingest(db, "Selwerd", _counts()[:3])
+    with pytest.raises(ValueError):
+        ingest_region_month(db, "Selwerd", MONTHS[1], 100, 5, "Geweld")
+
+
+def test_null_counts_and_single_month(db):
+    ingest_region_month(db, "Beijum", MONTHS[0], 40, None, None)
+    db.commit()
+    trend = db.query(RegionTrend).one()
+    assert trend.e33_shares == [0.0]
+    assert trend.latest_delta is None
+
+
+def test_rebuild_matches_incremental(db):
+    counts = _counts()
+    db.add_all(
+        Region(name="Selwerd", incident_count=c, e33_count=c // 10,
+               month_year=m, prevalent_crime_type="Geweld")
+        for m, c in zip(MONTHS, counts)
+    )
+    db.commit()
+    for m in MONTHS:
+        ingest_month(db, m)
+    incremental = db.query(RegionTrend).one()
+    expected = (incremental.rolling_means, incremental.z_scores, incremental.e33_shares)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", SAWarning)
+        rebuild_trends(db)
+        rebuild_trends(db)
+
+    trend = db.query(RegionTrend).one()
+    assert (trend.rolling_means, trend.z_scores, trend.e33_shares) == expected
+
+
+def test_ingest_same_month_twice_is_noop(db):
+    db.add(Region(name="Selwerd", incident_count=100, e33_count=10,
+                  month_year=MONTHS[0], prevalent_crime_type="Geweld"))
+    db.commit()
+
+    assert ingest_month(db, MONTHS[0]) == 1
+    assert ingest_month(db, MONTHS[0]) == 0
+    assert db.query(RegionTrend).one().months == [MONTHS[0]]
+
+
+def test_rebuild_skips_duplicate_region_months(db):
+    db.add_all(
+        Region(name="Selwerd", incident_count=c, e33_count=0,
+               month_year=m, prevalent_crime_type="Geweld")
+        for m, c in [(MONTHS[0], 100), (MONTHS[1], 120), (MONTHS[1], 999)]
+    )
+    db.commit()
+
+    assert rebuild_trends(db) == 2
+    assert db.query(RegionTrend).one().incident_counts == [100, 120]
+
+
+def test_rebuild_from_seed_schema(tmp_path):
+    path = tmp_path / "seed.db"
+    conn = sqlite3.connect(path)
+    ensure_schema(conn)
+    conn.executemany(
+        "INSERT INTO Regions (name, month_year, crime_level, incident_count, crime_type, e33_rate, lat, lon) "
+        "VALUES (?, ?, 5, ?, 'Drugs', 0.1, 53.2, 6.5)",
+        [("Beijum", m, 100 + i) for i, m in enumerate(MONTHS)],
+    )
+    conn.commit()
+    conn.close()
+
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        assert rebuild_trends(db) == len(MONTHS)
+        trend = db.query(RegionTrend).one()
+        assert trend.months == MONTHS
+        assert trend.e33_shares[0] == 0.1
+        assert trend.crime_type_counts == {"Drugs": len(MONTHS)}
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_trend_unknown_region_404(client):
+    assert client.get("/regions/Nowhere/trend").status_code == 404
+
+
+def test_risers_empty(client):
+    res = client.get("/regions/risers")
+    assert res.status_code == 200
+    assert res.json() == []
+
+
+def test_risers_rank_by_delta_and_skip_single_month(db, client):
+    _ingest(db, "Selwerd", [100, 130])
+    _ingest(db, "Beijum", [100, 110])
+    ingest_region_month(db, "Helpman", MONTHS[1], 500, 5, "Geweld")
+    db.commit()
+
+    res = client.get("/regions/risers").json()
+    assert [r["name"] for r in res] == ["Selwerd", "Beijum"]
+    assert res[0]["delta"] == 30
+
+    trend = client.get("/regions/Helpman/trend").json()
+    assert trend["latest_delta"] is None
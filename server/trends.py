@@ -0,0 +1,231 @@
+# server/trends.py
+#
+# Per-region monthly trend series (region_trends). Backfill an existing DB
+# once, then append each month as it lands (run from the repo root):
+#
+#   python -m server.trends rebuild
+#   python -m server.trends ingest 2025-09
+from __future__ import annotations
+
+import math
+import sys
+from typing import List, Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
+
+from .models import RegionTrend
+
+# Trailing window (in months) for rolling means and z-scores: a full year,
+# so seasonality doesn't read as an anomaly. A z-score is only emitted once
+# a full window of history exists, using the sample (n-1) std; with a
+# handful of points ordinary month-to-month noise gets flagged.
+WINDOW = 12
+# |z| at or above this marks a month as anomalous
+Z_THRESHOLD = 2.0
+
+_SERIES = (
+    "months",
+    "incident_counts",
+    "e33_shares",
+    "crime_types",
+    "rolling_means",
+    "z_scores",
+    "anomalies",
+)
+
+
+def _new_trend(name: str) -> RegionTrend:
+    return RegionTrend(
+        name=name,
+        months=[],
+        incident_counts=[],
+        e33_shares=[],
+        crime_types=[],
+        crime_type_counts={},
+        rolling_means=[],
+        z_scores=[],
+        anomalies=[],
+        window_sum=0.0,
+        window_sumsq=0.0,
+        latest_delta=None,
+    )
+
+
+def ingest_region_month(
+    db: Session,
+    name: str,
+    month_year: str,
+    incident_count: Optional[int],
+    e33_count: Optional[int],
+    crime_type: Optional[str],
+) -> RegionTrend:
+    """
+    Append one region-month to that region's trend series.
+
+    Months must arrive in order. The window statistics are updated from
+    the running sums and the value leaving the window, without rescanning
+    earlier months (the stored JSON series are still rewritten in full).
+    """
+    trend = db.query(RegionTrend).filter(RegionTrend.name == name).first()
+    if trend is None:
+        trend = _new_trend(name)
+        db.add(trend)
+
+    if trend.latest_month and month_year <= trend.latest_month:
+        raise ValueError(f"{name}: month {month_year} is not after {trend.latest_month}")
+
+    counts = trend.incident_counts
+    x = incident_count or 0
+
+    # z-score against the preceding window, before x enters it
+    z = None
+    if len(counts) >= WINDOW:
+        n = WINDOW
+        mean = trend.window_sum / n
+        var = max((trend.window_sumsq - trend.window_sum * mean) / (n - 1), 0.0)
+        if var > 0:
+            z = round((x - mean) / math.sqrt(var), 3)
+
+    trend.window_sum += x
+    trend.window_sumsq += x * x
+    if len(counts) >= WINDOW:
+        old = counts[-WINDOW]
+        trend.window_sum -= old
+        trend.window_sumsq -= old * old
+
+    trend.latest_delta = x - counts[-1] if counts else None
+    trend.latest_month = month_year
+
+    e33_share = ((e33_count or 0) / x) if x else 0.0
+
+    trend.months.append(month_year)
+    counts.append(x)
+    trend.e33_shares.append(round(e33_share, 3))
+    trend.crime_types.append(crime_type)
+    trend.rolling_means.append(round(trend.window_sum / min(len(counts), WINDOW), 3))
+    trend.z_scores.append(z)
+    trend.anomalies.append(z is not None and abs(z) >= Z_THRESHOLD)
+
+    type_counts = trend.crime_type_counts
+    if crime_type:
+        type_counts[crime_type] = type_counts.get(crime_type, 0) + 1
+
+    # JSON columns don't track in-place mutation
+    for attr in _SERIES + ("crime_type_counts",):
+        flag_modified(trend, attr)
+
+    return trend
+
+
+def _region_month_rows(db: Session, month_year: Optional[str] = None) -> List[dict]:
+    """
+    Read region-month rows straight from the regions table.
+
+    Handles both the ORM layout (e33_count, prevalent_crime_type) and the
+    one written by seed_groningen_city_safety.py (e33_rate, crime_type).
+    regions has no unique (name, month_year); duplicates keep the first row.
+    """
+    cols = {c["name"] for c in inspect(db.connection()).get_columns("regions")}
+    e33 = "e33_count" if "e33_count" in cols else "ROUND(e33_rate * incident_count)"
+    ctype = "prevalent_crime_type" if "prevalent_crime_type" in cols else "crime_type"
+
+    sql = (
+        f"SELECT name, month_year, incident_count, {e33} AS e33_count, "
+        f"{ctype} AS crime_type FROM regions "
+        "WHERE id IN (SELECT MIN(id) FROM regions GROUP BY name, month_year)"
+    )
+    params = {}
+    if month_year:
+        sql += " AND month_year = :month_year"
+        params["month_year"] = month_year
+    sql += " ORDER BY month_year, id"
+
+    return [dict(r._mapping) for r in db.execute(text(sql), params)]
+
+
+def ingest_month(db: Session, month_year: str) -> int:
+    """
+    Append a newly landed month (already stored in regions) to every
+    region's series. Regions that already have this month are skipped, so
+    re-running is a no-op. Returns the number of region rows ingested.
+    """
+    latest = dict(db.query(RegionTrend.name, RegionTrend.latest_month))
+    rows = [
+        r for r in _region_month_rows(db, month_year)
+        if latest.get(r["name"]) != month_year
+    ]
+    try:
+        for row in rows:
+            ingest_region_month(db, **row)
+            db.flush()
+    except Exception:
+        db.rollback()
+        raise
+    db.commit()
+    return len(rows)
+
+
+def rebuild_trends(db: Session) -> int:
+    """One-off backfill: drop all trend rows and replay every stored month."""
+    try:
+        db.query(RegionTrend).delete()
+        # SQLite reuses the freed ids; don't let stale identities linger
+        db.expunge_all()
+
+        rows = _region_month_rows(db)
+        for row in rows:
+            ingest_region_month(db, **row)
+            db.flush()
+    except Exception:
+        db.rollback()
+        raise
+    db.commit()
+    return len(rows)
+
+
+def trend_to_dict(trend: RegionTrend) -> dict:
+    months_seen = len(trend.months) or 1
+    return {
+        "name": trend.name,
+        "latest_month": trend.latest_month,
+        "latest_delta": trend.latest_delta,
+        "months": trend.months,
+        "incident_counts": trend.incident_counts,
+        "e33_shares": trend.e33_shares,
+        "crime_types": trend.crime_types,
+        "crime_type_mix": {
+            k: round(v / months_seen, 3) for k, v in trend.crime_type_counts.items()
+        },
+        "rolling_means": trend.rolling_means,
+        "z_scores": trend.z_scores,
+        "anomalies": trend.anomalies,
+        "window": WINDOW,
+    }
+
+
+def main(argv: List[str]) -> None:
+    from .db import Base, SessionLocal, engine
+
+    usage = "usage: python -m server.trends rebuild | ingest YYYY-MM"
+    if not argv or argv[0] not in ("rebuild", "ingest") or (argv[0] == "ingest" and len(argv) != 2):
+        sys.exit(usage)
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if argv[0] == "rebuild":
+            n = rebuild_trends(db)
+            print(f"Rebuilt trends from {n} region-month rows.")
+        else:
+            n = ingest_month(db, argv[1])
+            print(f"Ingested {n} region rows for {argv[1]}.")
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])